@@ -47,6 +47,7 @@ from feed_specs import (
     expected_root_locals,
     gather_primary_image,
     is_valid_gtin,
+    localname_lower,
     read_availability,
     read_id,
     read_link,
@@ -161,7 +162,7 @@ def audit_feed(path: str) -> dict:
                         break
                     item_locals = _item_locals(spec)
                 continue
-            if strip_ns(elem.tag).lower() not in item_locals:
+            if localname_lower(elem.tag) not in item_locals:
                 continue
 
             items += 1
@@ -2,13 +2,13 @@
 from __future__ import annotations
 from typing import List, Tuple, Dict, Any, Iterable
 import re
-from collections import defaultdict
 import os
 import gzip
 import tempfile
 import json
 import base64
 import hashlib
+import heapq
 import streamlit as st
 from urllib.parse import urljoin, urlparse
 
@@ -16,18 +16,18 @@ from urllib.parse import urljoin, urlparse
 from feed_specs import (
     SPEC,
     strip_ns,
+    localname_lower,              # memoized strip_ns(tag).lower() for the streaming loop
     detect_spec,
     get_item_nodes,               # used in DOM path
     read_id,
-    read_link,
     read_availability,
-    gather_primary_image,
     read_link_raw,                 # RAW (no percent-encoding) to warn on spaces/non-ASCII
     gather_primary_image_raw,      # RAW
+    percent_encode_url,            # RAW -> the encoded link/image the feed would ship
     read_price,                    # (amount, raw_text)
     analyze_price_text,            # shared amount+format analysis
     gather_gallery,                # IMGURL_ALTERNATIVE / gallery images
-    read_recommended_value,        # value of a recommended field (EAN, description, …)
+    read_recommended_fields,       # presence + value of every recommended field, one scan
     is_valid_gtin,                 # EAN/GTIN length + checksum
 )
 
@@ -45,15 +45,12 @@ except Exception:
         return (False, "")
 
 # Recommended-element coverage (description, category, delivery/shipping, …).
-# Falls back to a no-op if feed_specs hasn't been updated on this deployment.
+# Falls back to no checks if feed_specs hasn't been updated on this deployment.
 try:
-    from feed_specs import RECOMMENDED_FIELDS, present_recommended_fields
+    from feed_specs import RECOMMENDED_FIELDS
 except Exception:
     RECOMMENDED_FIELDS = []
 
-    def present_recommended_fields(elem) -> set:
-        return set()
-
 # Shared FAVI look-and-feel (Work Sans, crimson banner, themed cards/pills).
 from branding import inject_css, page_header, render_metric_row
 import feed_filter as ff
@@ -154,21 +151,15 @@ def clickup_card_metric(label: str, value: str):
         unsafe_allow_html=True,
     )
 
-def unique_preserve(xs: List[str]) -> List[str]:
-    seen = set()
-    out: List[str] = []
-    for x in xs:
-        if x not in seen:
-            seen.add(x)
-            out.append(x)
-    return out
-
 MAX_ROWS = 1000   # cap rows rendered per issue list, to keep the page light
 
-def show_issue_table(title: str, rows: List[Dict]):
+def show_issue_table(title: str, rows: List[Dict], total: int | None = None):
     """Render an issue category as a collapsed, expandable list with its count
-    in the label. Renders nothing when empty, so a clean feed stays uncluttered."""
-    n = len(rows)
+    in the label. Renders nothing when empty, so a clean feed stays uncluttered.
+
+    Pass `total` when `rows` was built for the first MAX_ROWS issues only — a
+    feed with 100k missing images then builds 1,000 row dicts, not 100k."""
+    n = len(rows) if total is None else total
     if n == 0:
         return
     with st.expander(f"{title} — {n}"):
@@ -177,19 +168,28 @@ def show_issue_table(title: str, rows: List[Dict]):
             st.caption(f"Showing the first {MAX_ROWS:,} of {n:,}.")
 
 # ---------- Tag helpers ----------
-def localname(tag: str) -> str:
-    raw = tag.split('}', 1)[1] if '}' in tag else tag
-    return raw.lower()
-
-def localnames_from_item_paths(spec_name: str) -> set[str]:
-    """Derive the set of valid item tag localnames from SPEC.item_paths for this spec."""
-    paths = SPEC.get(spec_name, {}).get("item_paths", [])
+def _item_localnames(paths: List[str]) -> frozenset[str]:
     names = set()
     for p in paths:
         last = p.split("/")[-1].strip(".")  # e.g. "SHOPITEM", "{ns}entry", "product"
         if last:
             names.add(strip_ns(last).lower())
-    return names
+    return frozenset(names)
+
+# Derived once at import: SPEC is static, and the streaming path asks on every
+# run (for an unknown format, for every spec at once).
+_ITEM_LOCALNAMES: Dict[str, frozenset[str]] = {
+    name: _item_localnames(cfg.get("item_paths", [])) for name, cfg in SPEC.items()
+}
+# Unknown format: every item tag any known spec uses (shopitem for Heureka, o
+# for Ceneo, …) plus the generic names.
+_ALL_ITEM_LOCALNAMES = frozenset({"item", "entry", "offer", "product"}).union(
+    *_ITEM_LOCALNAMES.values()
+)
+
+def localnames_from_item_paths(spec_name: str) -> frozenset[str]:
+    """Valid item tag localnames from SPEC.item_paths for this spec."""
+    return _ITEM_LOCALNAMES.get(spec_name, frozenset())
 
 def _clean_host(host: str) -> str:
     host = (host or "").lower().strip()
@@ -438,8 +438,12 @@ def is_gzip_path(path: str) -> bool:
     except Exception:
         return False
 
-def open_maybe_gzip(path: str):
-    return gzip.open(path, "rb") if is_gzip_path(path) else open(path, "rb")
+def open_maybe_gzip(path: str, is_gz: bool | None = None):
+    """Open a feed file, gunzipping when needed. Pass `is_gz` when the magic
+    bytes were already sniffed to skip re-opening the file just to read them."""
+    if is_gz is None:
+        is_gz = is_gzip_path(path)
+    return gzip.open(path, "rb") if is_gz else open(path, "rb")
 
 # ---------- Streaming parser ----------
 def iter_items_stream(file_like, wanted_localnames: Iterable[str]):
@@ -463,7 +467,7 @@ def iter_items_stream(file_like, wanted_localnames: Iterable[str]):
     open_wanted = 0  # how many wanted elements are currently open
 
     for event, elem in context:
-        ln = localname(elem.tag) if isinstance(elem.tag, str) else ""
+        ln = localname_lower(elem.tag) if isinstance(elem.tag, str) else ""
         if event == "start":
             if ln in want:
                 open_wanted += 1
@@ -483,7 +487,7 @@ def iter_items_stream(file_like, wanted_localnames: Iterable[str]):
     # If nothing matched, emit a hint in the UI
     if yielded == 0 and seen_counts:
         top = sorted(seen_counts.items(), key=lambda x: -x[1])[:10]
-        st.info("No items matched. Top end-tags seen: " + ", ".join(f"{k}×{v}" for k,v in top))
+        _note("info", "No items matched. Top end-tags seen: " + ", ".join(f"{k}×{v}" for k,v in top))
 
 # ---------- FAVI price-format validation ----------
 # Delegates to feed_specs.analyze_price_text: the format verdict and the
@@ -556,6 +560,11 @@ def url_quality_issue(u: str) -> str:
     invalid as spaces and non-ASCII."""
     if not u:
         return ""
+    # Fast path for the common clean URL: three C-level scans prove every
+    # character is in 0x21-0x7E, so the per-character checks below only run
+    # for URLs that are actually flagged.
+    if u.isascii() and u.isprintable() and " " not in u:
+        return ""
     if " " in u:
         return "Contains spaces"
     if any(ord(c) < 0x21 for c in u):
@@ -658,13 +667,45 @@ def _reset_buckets():
     cat_stats.update({"seen": 0, "with_path": 0, "nonnumeric": 0})
 
 
+# Everything a finished parse leaves for render_validation(): the run-level
+# results plus every bucket process_item() fills. (id_first_seen/link_first_seen
+# are parse-time scratch — the duplicate pairs already hold their result.)
+_RUN_RESULT_NAMES = (
+    "xml_ok", "spec_name", "total_items", "processed_items",
+    "ids", "links", "images", "avails", "prices_amt", "prices_raw",
+    "missing_id_idx", "missing_link_idx", "missing_img_idx", "missing_avail_idx",
+    "recommended_missing", "recommended_gap_idx", "missing_price_idx",
+    "bad_price_idx", "invalid_price_format_idx", "overprecision_price_idx",
+    "raw_links", "raw_imgs", "bad_url_idx", "bad_img_idx",
+    "dup_id_pairs", "dup_link_pairs", "bad_url_note", "bad_img_note",
+    "bad_id_format_idx", "invalid_avail_idx", "avail_issue_note",
+    "insecure_img_idx", "insecure_img_note", "bad_imgtype_idx", "bad_imgtype_note",
+    "gallery_over_idx", "gallery_count_note", "invalid_ean_idx", "ean_value_note",
+    "desc_content_idx", "desc_content_note", "cat_stats",
+)
+
+# Status lines the parse paths showed ("XML syntax: OK", fallbacks, …), kept so
+# a run restored from the memo renders exactly what the real run did.
+_parse_notes: List[Tuple[str, str]] = []
+
+
+def _note(kind: str, text: str) -> None:
+    """st.success/info/warning/error/caption(text), recorded for replay."""
+    getattr(st, kind)(text)
+    _parse_notes.append((kind, text))
+
+
 def process_item(elem, index: int, spec: str):
+    # Each field is read ONCE: the encoded link/image are derived from the raw
+    # reads (read_link/gather_primary_image would re-walk the same paths), and
+    # every recommended field comes from a single scan of the item.
     pid = (read_id(elem, spec) or "").strip()
-    purl = (read_link(elem, spec) or "").strip()
     pav  = (read_availability(elem, spec) or "").strip()
-    pimg = (gather_primary_image(elem, spec) or "").strip()
     purl_raw = (read_link_raw(elem, spec) or "").strip()
     pimg_raw = (gather_primary_image_raw(elem, spec) or "").strip()
+    purl = percent_encode_url(purl_raw).strip() if purl_raw else ""
+    pimg = percent_encode_url(pimg_raw).strip() if pimg_raw else ""
+    present_rec, rec_vals = read_recommended_fields(elem)
 
     # PRICE read
     try:
@@ -685,7 +726,6 @@ def process_item(elem, index: int, spec: str):
 
     # Recommended / content elements (FAVI-documented; non-blocking)
     if RECOMMENDED_FIELDS:
-        present_rec = present_recommended_fields(elem)
         missing_any = False
         for f in RECOMMENDED_FIELDS:
             if f["key"] not in present_rec:
@@ -750,19 +790,19 @@ def process_item(elem, index: int, spec: str):
             insecure_img_note[index] = "gallery image not HTTPS (FAVI requires https://)"
 
     # EAN/GTIN value: 8/12/13/14 digits + GS1 checksum
-    ean_val = read_recommended_value(elem, "gtin")
+    ean_val = rec_vals.get("gtin", "")
     if ean_val and not is_valid_gtin(ean_val):
         invalid_ean_idx.append(index); ean_value_note[index] = ean_val
 
     # Description content rules (no URLs/e-mails, allowed HTML subset only)
-    desc_val = read_recommended_value(elem, "description")
+    desc_val = rec_vals.get("description", "")
     if desc_val:
         note = description_content_issues(desc_val)
         if note:
             desc_content_idx.append(index); desc_content_note[index] = note
 
     # Category full-path stats (feed-level verdict after the run)
-    cat_val = read_recommended_value(elem, "category")
+    cat_val = rec_vals.get("category", "")
     if cat_val:
         cat_stats["seen"] += 1
         if (">" in cat_val) or ("|" in cat_val):
@@ -770,27 +810,29 @@ def process_item(elem, index: int, spec: str):
         if not cat_val.replace(" ", "").isdigit():
             cat_stats["nonnumeric"] += 1
 
-    # Duplicate tracking
+    # Duplicate tracking: one dict probe per value. setdefault records the
+    # first index and hands it back on a repeat, so a clean feed never pays
+    # for a second lookup.
     if pid:
-        if pid in id_first_seen:
-            dup_id_pairs.append((id_first_seen[pid], index, pid))
-        else:
-            id_first_seen[pid] = index
+        first = id_first_seen.setdefault(pid, index)
+        if first != index:
+            dup_id_pairs.append((first, index, pid))
 
     if purl:
-        if purl in link_first_seen:
-            dup_link_pairs.append((link_first_seen[purl], index, purl))
-        else:
-            link_first_seen[purl] = index
+        first = link_first_seen.setdefault(purl, index)
+        if first != index:
+            dup_link_pairs.append((first, index, purl))
 
 # ---------- DOM path (Auto + small, non-gz, and only if NOT sample mode) ----------
 def run_dom_path() -> bool:
     global xml_ok, spec_name, total_items, processed_items
     try:
-        with open_maybe_gzip(src_path) as fh:
-            xml_bytes = fh.read()
-        root = ET.fromstring(xml_bytes)
-        st.success("XML syntax: OK")
+        # Parse straight from the (possibly gzip) file object: the parser pulls
+        # it in chunks, so the whole feed never sits in memory as bytes next
+        # to the tree built from it.
+        with open_maybe_gzip(src_path, src_is_gz) as fh:
+            root = ET.parse(fh).getroot()
+        _note("success", "XML syntax: OK")
         spec = detect_spec(root) or "UNKNOWN"
         items = get_item_nodes(root, spec) if spec != "UNKNOWN" else []
         total = len(items)
@@ -800,27 +842,28 @@ def run_dom_path() -> bool:
         total_items = total
         processed_items = total
         return True
-    except ET.ParseError as e:
-        st.error(f"XML syntax: ERROR — {e}")
-        if stop_on_first_parse_error:
-            st.stop()
+    except ET.ParseError:
+        # A DOM parse yields nothing on error. Fall back to streaming, which
+        # reports the error AND checks every item before it, instead of making
+        # the operator re-submit just to see the well-formed part of the feed.
         return False
     except MemoryError:
-        st.warning("Memory pressure detected with DOM path; falling back to streaming.")
+        _note("warning", "Memory pressure detected with DOM path; falling back to streaming.")
         return False
     except Exception as e:
-        st.warning(f"DOM path failed ({e}). Falling back to streaming.")
+        _note("warning", f"DOM path failed ({e}). Falling back to streaming.")
         return False
 
 # ---------- Streaming path (Auto-large, any .gz, or Sample mode) ----------
-def _detect_spec_from_prefix(path: str, prefix_bytes: int = 262144) -> str:
+def _detect_spec_from_prefix(path: str, prefix_bytes: int = 262144,
+                             is_gz: bool | None = None) -> str:
     """
     Read a small prefix of the file into a mini-DOM for spec detection.
     We wrap the snippet in a synthetic root if needed so ElementTree can parse it.
     Falls back to root-tag-only detection if the snippet is not well-formed.
     """
     import io
-    with open_maybe_gzip(path) as fh:
+    with open_maybe_gzip(path, is_gz) as fh:
         raw = fh.read(prefix_bytes)
     # Try full parse of the prefix (works if feed is tiny or prefix captures whole root)
     try:
@@ -861,9 +904,10 @@ def run_stream_path(limit: int | None):
     # MemoryError mid-file) — start from a clean slate or every re-seen ID
     # would become a false duplicate.
     _reset_buckets()
+    processed = 0
     try:
         # Quick root/spec detection using a small prefix (captures root + a few items)
-        spec_name_local = _detect_spec_from_prefix(src_path)
+        spec_name_local = _detect_spec_from_prefix(src_path, is_gz=src_is_gz)
         spec_name = spec_name_local
 
         # Build exact set of item tag localnames from SPEC (no broad fallback for known specs)
@@ -872,21 +916,17 @@ def run_stream_path(limit: int | None):
             if not item_tags:
                 item_tags = {"item", "entry", "offer"}
         else:
-            # Unknown format: search every item tag any known spec uses
-            # (shopitem for Heureka, o for Ceneo, …) plus the generic names,
-            # so we can at least COUNT items instead of reporting a suspicious
+            # Unknown format: search every item tag any known spec uses, so
+            # we can at least COUNT items instead of reporting a suspicious
             # all-green run over zero items.
-            item_tags = {"item", "entry", "offer", "product"}
-            for _s in SPEC:
-                item_tags |= localnames_from_item_paths(_s)
+            item_tags = _ALL_ITEM_LOCALNAMES
 
-        st.caption("Looking for item tags: " + ", ".join(sorted(list(item_tags))))
+        _note("caption", "Looking for item tags: " + ", ".join(sorted(list(item_tags))))
 
         unknown_spec = not spec_name or spec_name.upper() == "UNKNOWN"
 
         # Full streaming pass
-        processed = 0
-        with open_maybe_gzip(src_path) as fh2:
+        with open_maybe_gzip(src_path, src_is_gz) as fh2:
             for elem, root in iter_items_stream(fh2, wanted_localnames=item_tags):
                 total_items += 1
 
@@ -905,17 +945,28 @@ def run_stream_path(limit: int | None):
                 processed += 1
         processed_items = processed
         # Only now has the whole document actually been parsed.
-        st.success("XML syntax: OK")
+        _note("success", "XML syntax: OK")
         if unknown_spec and total_items:
-            st.info(
+            _note(
+                "info",
                 f"Format not recognized — {total_items} item-like elements were "
                 "counted but field checks were skipped (there is no path table "
                 "to read fields from). Identify/convert the feed format first."
             )
     except ET.ParseError as e:
         xml_ok = False
-        st.error(f"XML syntax: ERROR — {e}")
-        if stop_on_first_parse_error:
+        processed_items = processed
+        _note("error", f"XML syntax: ERROR — {e}")
+        if processed:
+            # Every item before the error was well-formed and is already
+            # checked: keep that partial result rather than discard the work.
+            _note(
+                "warning",
+                f"Parsing stopped at the error above — the checks below cover "
+                f"the {processed:,} items read before it."
+            )
+        elif stop_on_first_parse_error:
+            # Nothing was checked, so there is no partial result to show.
             st.stop()
     except Exception as e:
         st.error(f"Streaming parser error: {e}")
@@ -923,8 +974,27 @@ def run_stream_path(limit: int | None):
 
 
 
-def render_validation():
-    # Decide and run
+def _run_checks() -> bool:
+    """Parse and check the loaded feed; returns whether streaming was used.
+
+    Widgets outside the Browse fragment (the ClickUp draft, the param-index
+    toggle, …) re-run the whole script, so a finished run is memoized by content
+    signature + the options the parse depends on — the same pattern as
+    _prepare_browse_table(). A rerun that changes none of them restores the
+    buckets and replays the status lines instead of re-parsing the feed. Runs
+    that end in st.stop() never reach the memo and simply parse again."""
+    run_sig = f"{content_hash}::{scope}::{n_limit}::{int(stop_on_first_parse_error)}"
+    memo = st.session_state.get("checker_run_memo")
+    if memo is not None and memo["sig"] == run_sig:
+        globals().update(memo["results"])
+        for kind, text in memo["notes"]:
+            getattr(st, kind)(text)
+        return memo["used_streaming"]
+
+    # Drop the previous run before parsing, not after: its buckets are as
+    # uncapped as this run's, and holding both would double peak memory.
+    st.session_state.pop("checker_run_memo", None)
+    _parse_notes.clear()
     used_streaming = False
     if use_sample_mode:
         used_streaming = True
@@ -939,6 +1009,21 @@ def render_validation():
                 used_streaming = True
                 run_stream_path(limit=None)
 
+    # One entry only (the latest run), and the old one is gone before the
+    # parse, so the memo never holds more than the buckets this run renders.
+    g = globals()
+    st.session_state["checker_run_memo"] = {
+        "sig": run_sig,
+        "used_streaming": used_streaming,
+        "results": {name: g[name] for name in _RUN_RESULT_NAMES},
+        "notes": list(_parse_notes),
+    }
+    return used_streaming
+
+
+def render_validation():
+    used_streaming = _run_checks()
+
     # ---------- TOP ROW ----------
     st.markdown("---")
 
@@ -1186,12 +1271,8 @@ def render_validation():
         )
 
     # ---------- DETAILS ----------
-    def safe_get(lst, i, default=""):
-        try:
-            return lst[i]
-        except Exception:
-            return default
-
+    # process_item() appends to every per-item list together, once per checked
+    # item, so every issue index below is in range and can index them directly.
     has_detail_issues = any([
         missing_id_idx, missing_link_idx, missing_img_idx, missing_avail_idx,
         missing_price_idx, bad_price_idx, invalid_price_format_idx, overprecision_price_idx,
@@ -1205,67 +1286,67 @@ def render_validation():
     elif processed_items > 0:
         st.success("No issues in the core checks — IDs, URLs, images, prices, and availability all look good.")
 
-    # Missing fields. NOTE: no "if safe_get(ids, i)" filters — items lacking an ID
+    # Missing fields. NOTE: no "if ids[i]" filters — items lacking an ID
     # too must still appear (otherwise summary counts disagree with the tables and
     # a table can vanish entirely while its warning stands).
     missing_id_rows = [
-        {"id": "(missing)", "link": safe_get(links, i), "image": "yes" if safe_get(images, i) else "no", "availability": safe_get(avails, i) or "(missing)"}
-        for i in missing_id_idx
+        {"id": "(missing)", "link": links[i], "image": "yes" if images[i] else "no", "availability": avails[i] or "(missing)"}
+        for i in missing_id_idx[:MAX_ROWS]
     ]
-    show_issue_table("Missing ID (by example values)", missing_id_rows)
+    show_issue_table("Missing ID (by example values)", missing_id_rows, total=len(missing_id_idx))
 
     missing_link_rows = [
-        {"id": safe_get(ids, i) or "(missing id)", "link": "(missing)", "image": "yes" if safe_get(images, i) else "no", "availability": safe_get(avails, i) or "(missing)"}
-        for i in missing_link_idx
+        {"id": ids[i] or "(missing id)", "link": "(missing)", "image": "yes" if images[i] else "no", "availability": avails[i] or "(missing)"}
+        for i in missing_link_idx[:MAX_ROWS]
     ]
-    show_issue_table("Missing Product URL (by product ID)", missing_link_rows)
+    show_issue_table("Missing Product URL (by product ID)", missing_link_rows, total=len(missing_link_idx))
 
     missing_img_rows = [
-        {"id": safe_get(ids, i) or "(missing id)", "link": safe_get(links, i), "primary_image": "(missing)"}
-        for i in missing_img_idx
+        {"id": ids[i] or "(missing id)", "link": links[i], "primary_image": "(missing)"}
+        for i in missing_img_idx[:MAX_ROWS]
     ]
-    show_issue_table("Missing Primary Image (by product ID)", missing_img_rows)
+    show_issue_table("Missing Primary Image (by product ID)", missing_img_rows, total=len(missing_img_idx))
 
     missing_avail_rows = [
-        {"id": safe_get(ids, i) or "(missing id)", "link": safe_get(links, i), "availability": "(missing)"}
-        for i in missing_avail_idx
+        {"id": ids[i] or "(missing id)", "link": links[i], "availability": "(missing)"}
+        for i in missing_avail_idx[:MAX_ROWS]
     ]
-    show_issue_table("Missing Availability (by product ID)", missing_avail_rows)
+    show_issue_table("Missing Availability (by product ID)", missing_avail_rows, total=len(missing_avail_idx))
 
     # PRICE details
     missing_price_rows = [
-        {"id": safe_get(ids, i) or "(missing id)", "link": safe_get(links, i), "raw_price": "(missing)"}
-        for i in missing_price_idx
+        {"id": ids[i] or "(missing id)", "link": links[i], "raw_price": "(missing)"}
+        for i in missing_price_idx[:MAX_ROWS]
     ]
-    show_issue_table("Missing Price (by product ID)", missing_price_rows)
+    show_issue_table("Missing Price (by product ID)", missing_price_rows, total=len(missing_price_idx))
 
     bad_price_rows = [
-        {"id": safe_get(ids, i) or "(missing id)",
-         "link": safe_get(links, i),
-         "raw_price": safe_get(prices_raw, i) or "(missing)",
-         "parsed_amount": safe_get(prices_amt, i),
+        {"id": ids[i] or "(missing id)",
+         "link": links[i],
+         "raw_price": prices_raw[i] or "(missing)",
+         "parsed_amount": prices_amt[i],
         }
-        for i in bad_price_idx
+        for i in bad_price_idx[:MAX_ROWS]
     ]
-    show_issue_table("Invalid Price (non-numeric or <= 0) by product ID", bad_price_rows)
+    show_issue_table("Invalid Price (non-numeric or <= 0) by product ID", bad_price_rows, total=len(bad_price_idx))
 
     invalid_format_rows = [
-        {"id": safe_get(ids, i) or "(missing id)",
-         "link": safe_get(links, i),
-         "raw_price": safe_get(prices_raw, i) or "(missing)",
+        {"id": ids[i] or "(missing id)",
+         "link": links[i],
+         "raw_price": prices_raw[i] or "(missing)",
          "note": "Format not allowed by FAVI (dot-as-thousands/comma-as-thousands/etc.)"}
-        for i in invalid_price_format_idx
+        for i in invalid_price_format_idx[:MAX_ROWS]
     ]
-    show_issue_table("Price format violations (FAVI rules)", invalid_format_rows)
+    show_issue_table("Price format violations (FAVI rules)", invalid_format_rows, total=len(invalid_price_format_idx))
 
     overprecision_rows = [
-        {"id": safe_get(ids, i) or "(missing id)",
-         "link": safe_get(links, i),
-         "raw_price": safe_get(prices_raw, i) or "(missing)",
+        {"id": ids[i] or "(missing id)",
+         "link": links[i],
+         "raw_price": prices_raw[i] or "(missing)",
          "note": "More than 2 decimals — FAVI rounds automatically"}
-        for i in overprecision_price_idx
+        for i in overprecision_price_idx[:MAX_ROWS]
     ]
-    show_issue_table("Price over-precision (> 2 decimals) informational", overprecision_rows)
+    show_issue_table("Price over-precision (> 2 decimals) informational", overprecision_rows, total=len(overprecision_price_idx))
 
     if bad_url_idx or bad_img_idx:
         st.markdown("### URL encoding issues")
@@ -1274,109 +1355,119 @@ def render_validation():
         )
 
     bad_url_rows = [
-        {"id": safe_get(ids, i) or "(missing id)",
-         "raw_url": safe_get(raw_links, i),
-         "encoded_url": safe_get(links, i),
+        {"id": ids[i] or "(missing id)",
+         "raw_url": raw_links[i],
+         "encoded_url": links[i],
          "issue": bad_url_note.get(i, "")}
-        for i in bad_url_idx
+        for i in bad_url_idx[:MAX_ROWS]
     ]
-    show_issue_table("Product URLs requiring encoding", bad_url_rows)
+    show_issue_table("Product URLs requiring encoding", bad_url_rows, total=len(bad_url_idx))
 
     bad_img_rows = [
-        {"id": safe_get(ids, i) or "(missing id)",
-         "raw_image_url": safe_get(raw_imgs, i),
-         "encoded_image_url": safe_get(images, i),
+        {"id": ids[i] or "(missing id)",
+         "raw_image_url": raw_imgs[i],
+         "encoded_image_url": images[i],
          "issue": bad_img_note.get(i, "")}
-        for i in bad_img_idx
+        for i in bad_img_idx[:MAX_ROWS]
     ]
-    show_issue_table("Image URLs requiring encoding", bad_img_rows)
+    show_issue_table("Image URLs requiring encoding", bad_img_rows, total=len(bad_img_idx))
 
     # ---------- VALUE-LEVEL CHECKS (warn-only) ----------
     bad_id_format_rows = [
-        {"id": safe_get(ids, i), "link": safe_get(links, i),
+        {"id": ids[i], "link": links[i],
          "note": "FAVI IDs allow only letters, digits, '-' and '_' (no spaces/diacritics)"}
-        for i in bad_id_format_idx
+        for i in bad_id_format_idx[:MAX_ROWS]
     ]
-    show_issue_table("ID format violations (FAVI charset)", bad_id_format_rows)
+    show_issue_table("ID format violations (FAVI charset)", bad_id_format_rows, total=len(bad_id_format_idx))
 
     invalid_avail_rows = [
-        {"id": safe_get(ids, i) or "(missing id)", "availability": safe_get(avails, i),
+        {"id": ids[i] or "(missing id)", "availability": avails[i],
          "issue": avail_issue_note.get(i, "")}
-        for i in invalid_avail_idx
+        for i in invalid_avail_idx[:MAX_ROWS]
     ]
-    show_issue_table("Invalid availability values", invalid_avail_rows)
+    show_issue_table("Invalid availability values", invalid_avail_rows, total=len(invalid_avail_idx))
 
     insecure_img_rows = [
-        {"id": safe_get(ids, i) or "(missing id)", "image": safe_get(raw_imgs, i),
+        {"id": ids[i] or "(missing id)", "image": raw_imgs[i],
          "issue": insecure_img_note.get(i, "")}
-        for i in insecure_img_idx
+        for i in insecure_img_idx[:MAX_ROWS]
     ]
-    show_issue_table("Image URLs not using HTTPS", insecure_img_rows)
+    show_issue_table("Image URLs not using HTTPS", insecure_img_rows, total=len(insecure_img_idx))
 
     bad_imgtype_rows = [
-        {"id": safe_get(ids, i) or "(missing id)", "image": safe_get(raw_imgs, i),
+        {"id": ids[i] or "(missing id)", "image": raw_imgs[i],
          "issue": bad_imgtype_note.get(i, "")}
-        for i in bad_imgtype_idx
+        for i in bad_imgtype_idx[:MAX_ROWS]
     ]
-    show_issue_table("Image file type not PNG/JPEG", bad_imgtype_rows)
+    show_issue_table("Image file type not PNG/JPEG", bad_imgtype_rows, total=len(bad_imgtype_idx))
 
     gallery_over_rows = [
-        {"id": safe_get(ids, i) or "(missing id)", "gallery_images": gallery_count_note.get(i, 0),
+        {"id": ids[i] or "(missing id)", "gallery_images": gallery_count_note.get(i, 0),
          "note": "FAVI reads at most 20 alternative images per product"}
-        for i in gallery_over_idx
+        for i in gallery_over_idx[:MAX_ROWS]
     ]
-    show_issue_table("Too many gallery images (> 20)", gallery_over_rows)
+    show_issue_table("Too many gallery images (> 20)", gallery_over_rows, total=len(gallery_over_idx))
 
     invalid_ean_rows = [
-        {"id": safe_get(ids, i) or "(missing id)", "ean": ean_value_note.get(i, ""),
+        {"id": ids[i] or "(missing id)", "ean": ean_value_note.get(i, ""),
          "note": "must be 8/12/13/14 digits passing the GS1 checksum — never internal IDs"}
-        for i in invalid_ean_idx
+        for i in invalid_ean_idx[:MAX_ROWS]
     ]
-    show_issue_table("Invalid EAN/GTIN values", invalid_ean_rows)
+    show_issue_table("Invalid EAN/GTIN values", invalid_ean_rows, total=len(invalid_ean_idx))
 
     desc_content_rows = [
-        {"id": safe_get(ids, i) or "(missing id)", "issue": desc_content_note.get(i, "")}
-        for i in desc_content_idx
+        {"id": ids[i] or "(missing id)", "issue": desc_content_note.get(i, "")}
+        for i in desc_content_idx[:MAX_ROWS]
     ]
-    show_issue_table("Description content issues", desc_content_rows)
+    show_issue_table("Description content issues", desc_content_rows, total=len(desc_content_idx))
 
-    # Duplicates (IDs)
-    dup_ids_map: Dict[str, List[int]] = defaultdict(list)
+    # Duplicates (IDs). Each group is a dict used as an ordered set, so the
+    # item indices come out unique and in feed order without a second pass.
+    dup_ids_map: Dict[str, Dict[int, None]] = {}
     for old_i, new_i, pid in dup_id_pairs:
-        dup_ids_map[pid].extend([old_i, new_i])
+        group = dup_ids_map.setdefault(pid, {})
+        group[old_i] = None
+        group[new_i] = None
 
+    # Only the MAX_ROWS groups that get rendered are turned into rows; nsmallest
+    # picks them in exactly the order a full sort + slice would.
     dup_id_rows = []
-    for pid, idxs in dup_ids_map.items():
-        idxs_u = unique_preserve([str(x) for x in idxs])
-        ex_links = unique_preserve([safe_get(links, int(i)) for i in idxs_u if safe_get(links, int(i))])[:3]
+    for pid, idxs in heapq.nsmallest(
+        MAX_ROWS, dup_ids_map.items(), key=lambda kv: (-len(kv[1]), kv[0])
+    ):
+        ex_links = list(dict.fromkeys(
+            links[i] for i in idxs if links[i]
+        ))[:3]
         dup_id_rows.append({
             "id": pid,
-            "occurrences": len(unique_preserve([str(int(i)) for i in idxs])),
+            "occurrences": len(idxs),
             "example_links": " | ".join(ex_links) if ex_links else ""
         })
-    dup_id_rows.sort(key=lambda r: (-r["occurrences"], r["id"]))
-    show_issue_table("Duplicate IDs (grouped)", dup_id_rows)
+    show_issue_table("Duplicate IDs (grouped)", dup_id_rows, total=len(dup_ids_map))
 
     # Duplicates (URLs). Items without an ID get a placeholder so a duplicated
     # URL still produces a row (the summary error must never point at an empty
     # table just because the colliding items lack IDs).
-    url_to_ids: Dict[str, List[str]] = defaultdict(list)
+    url_to_ids: Dict[str, Dict[str, None]] = {}
     for old_i, new_i, url in dup_link_pairs:
-        oid = safe_get(ids, old_i) or f"(missing id, item {old_i})"
-        nid = safe_get(ids, new_i) or f"(missing id, item {new_i})"
-        url_to_ids[url].append(oid)
-        url_to_ids[url].append(nid)
+        oid = ids[old_i] or f"(missing id, item {old_i})"
+        nid = ids[new_i] or f"(missing id, item {new_i})"
+        group = url_to_ids.setdefault(url, {})
+        group[oid] = None
+        group[nid] = None
 
     dup_url_rows = []
-    for url, idlist in url_to_ids.items():
-        ids_u = unique_preserve(idlist)
+    for url, id_group in heapq.nsmallest(
+        MAX_ROWS, url_to_ids.items(), key=lambda kv: (-len(kv[1]), kv[0])
+    ):
+        ids_u = list(id_group)
         dup_url_rows.append({
             "url": url,
             "num_ids": len(ids_u),
             "ids": ", ".join(ids_u[:12]) + (" …" if len(ids_u) > 12 else "")
         })
-    dup_url_rows.sort(key=lambda r: (-r["num_ids"], r["url"]))
-    show_issue_table("Duplicate Product URLs (grouped, with IDs)", dup_url_rows)
+    show_issue_table("Duplicate Product URLs (grouped, with IDs)", dup_url_rows,
+                     total=len(url_to_ids))
 
     # ---------- RECOMMENDED ELEMENTS ----------
     if RECOMMENDED_FIELDS:
@@ -1396,10 +1487,10 @@ def render_validation():
             any_recommended_missing = True
             tag = "FAVI required" if f["required"] else "recommended"
             rec_rows = [
-                {"id": safe_get(ids, i) or "(missing id)", "link": safe_get(links, i)}
-                for i in miss
+                {"id": ids[i] or "(missing id)", "link": links[i]}
+                for i in miss[:MAX_ROWS]
             ]
-            show_issue_table(f"Missing {f['label']} ({tag})", rec_rows)
+            show_issue_table(f"Missing {f['label']} ({tag})", rec_rows, total=len(miss))
         if not any_recommended_missing:
             st.success("All recommended elements are present on every item checked.")
 
@@ -1526,7 +1617,14 @@ with col_left:
                 "Sample size (items) — used only in sample mode",
                 min_value=100, max_value=200_000, value=5_000, step=500,
             )
-            stop_on_first_parse_error = st.checkbox("Stop on first XML parse error", value=True)
+            stop_on_first_parse_error = st.checkbox(
+                "Stop if the XML breaks before the first item",
+                value=True,
+                help="An XML error after some items were read never discards "
+                "them: those items are checked and reported as a partial result. "
+                "This only decides what happens when not a single item could be "
+                "read — stop at the error, or still render the (empty) report.",
+            )
         submitted = st.form_submit_button("Load feed", type="primary", width="stretch")
 
 # Fetch once on submit and remember the feed so both panels work off one load and
@@ -1551,7 +1649,8 @@ if submitted:
     if _p:
         _sz = os.path.getsize(_p) if os.path.exists(_p) else 0
         st.session_state["loaded_feed"] = {
-            "path": _p, "label": _lbl, "size": _sz, "content_hash": _hash, "scope": scope,
+            "path": _p, "label": _lbl, "size": _sz, "content_hash": _hash,
+            "is_gz": is_gzip_path(_p), "scope": scope,
             "n_limit": int(n_limit), "stop_on_first_parse_error": bool(stop_on_first_parse_error),
         }
 
@@ -1565,7 +1664,12 @@ if _feed:
     scope = _feed["scope"]
     n_limit = _feed["n_limit"]
     stop_on_first_parse_error = _feed["stop_on_first_parse_error"]
-    auto_force_streaming = is_gzip_path(src_path) or (file_size > SMALL_SIZE_LIMIT)
+    # Sniffed once at load; every parse pass below reuses it instead of
+    # re-opening the file for the two magic bytes.
+    src_is_gz = _feed.get("is_gz")
+    if src_is_gz is None:
+        src_is_gz = is_gzip_path(src_path)
+    auto_force_streaming = src_is_gz or (file_size > SMALL_SIZE_LIMIT)
     use_sample_mode = (scope == "Sample first N items")
     # Cross-page hand-off: the standalone Feed Filter page can reuse this feed.
     st.session_state["shared_feed_path"] = src_path
@@ -41,6 +41,7 @@ except Exception:  # pragma: no cover - defusedxml is optional
 from feed_specs import (
     SPEC,
     strip_ns,
+    localname_lower,
     detect_spec,
     read_id,
     read_link,
@@ -48,7 +49,7 @@ from feed_specs import (
     read_price,
     gather_primary_image,
     gather_gallery,
-    read_recommended_value,
+    read_recommended_fields,
     is_valid_gtin,
     _named_param_values,   # name->value pairs from <PARAM>/<attrs> containers
 )
@@ -373,7 +374,7 @@ def _detect_spec_stream(path: str) -> Tuple[str, int, bool]:
         stack = [root]
         for event, elem in ctx:
             local = (
-                strip_ns(elem.tag).lower()
+                localname_lower(elem.tag)
                 if isinstance(elem.tag, str)
                 else ""
             )
@@ -448,7 +449,7 @@ def _iter_items_stream(file_like, wanted_localnames: Iterable[str]):
         file_like.start_item()
     stack = [root]
     for event, elem in ctx:
-        ln = strip_ns(elem.tag).lower() if isinstance(elem.tag, str) else ""
+        ln = localname_lower(elem.tag) if isinstance(elem.tag, str) else ""
         if event == "start":
             stack.append(elem)
             if open_wanted == 0 and ln in want:
@@ -508,12 +509,16 @@ def _add_row(table: FeedTable, elem, spec: str, interns: Dict[str, dict],
         amt = None
     pid = (read_id(elem, spec) or "").strip()
     purl = (read_link(elem, spec) or "").strip()
-    title = (read_recommended_value(elem, "title") or "").strip()
+    # One scan for all recommended fields instead of a rescan per field; the
+    # named parameters it needs are reused for the param index below.
+    named = _named_param_values(elem)
+    _present, rec = read_recommended_fields(elem, named)
+    title = rec.get("title", "")
     avail = (read_availability(elem, spec) or "").strip()
-    brand = (read_recommended_value(elem, "brand") or "").strip()
-    cat = (read_recommended_value(elem, "category") or "").strip()
-    desc = (read_recommended_value(elem, "description") or "").strip()
-    ean = (read_recommended_value(elem, "gtin") or "").strip()
+    brand = rec.get("brand", "")
+    cat = rec.get("category", "")
+    desc = rec.get("description", "")
+    ean = rec.get("gtin", "")
     primary_url = (gather_primary_image(
         elem, spec, do_percent_encode=False
     ) or "").strip()
@@ -545,8 +550,8 @@ def _add_row(table: FeedTable, elem, spec: str, interns: Dict[str, dict],
     cols["has_brand"].append(bool(brand))
     cols["has_category"].append(bool(cat))
     if index_params:
-        params = _named_param_values(elem)  # {name_lower: value}
-        cols["param"].append({k: _intern("param", v) for k, v in params.items()})
+        # named is {name_lower: value}
+        cols["param"].append({k: _intern("param", v) for k, v in named.items()})
     else:
         cols["param"].append(None)
 
@@ -17,13 +17,62 @@ NS = {
     "hz": "http://www.zbozi.cz/ns/offer/1.0",
 }
 
+# ElementPath builds a sorted() cache key from `namespaces=` on EVERY find()
+# call. Expanding prefixes to Clark notation ("./g:id" -> "./{uri}id") once per
+# distinct path lets the hot readers call find() without a namespaces map. The
+# paths come from SPEC and a few detection literals, so the memo stays small.
+_NS_PREFIX_RE = re.compile(r"(?<![\w.-])([A-Za-z_][\w.-]*):(?=[A-Za-z_*])")
+_CLARK_PATHS: Dict[str, str] = {}
+
+
+def _clark(path: str) -> str:
+    got = _CLARK_PATHS.get(path)
+    if got is None:
+        # Leave existing {uri} segments alone: the URIs contain colons too.
+        got = "".join(
+            part if part.startswith("{") else _NS_PREFIX_RE.sub(
+                lambda m: "{%s}" % NS[m.group(1)] if m.group(1) in NS else m.group(0),
+                part,
+            )
+            for part in re.split(r"(\{[^}]*\})", path)
+        )
+        _CLARK_PATHS[path] = got
+    return got
+
 # -------------------- Small helpers --------------------
+# Every item repeats the same handful of tags (the parser hands back one str
+# per distinct name), so stripped names are memoized. Capped so a feed with
+# unbounded distinct tag names can't grow the memo without limit.
+_LOCALNAMES: Dict[str, str] = {}
+_LOCALNAMES_MAX = 4096
+
+
 def strip_ns(tag: str) -> str:
-    return tag.split('}', 1)[1] if isinstance(tag, str) and '}' in tag else tag
+    if not isinstance(tag, str):
+        return tag
+    got = _LOCALNAMES.get(tag)
+    if got is None:
+        got = tag.split('}', 1)[1] if '}' in tag else tag
+        if len(_LOCALNAMES) < _LOCALNAMES_MAX:
+            _LOCALNAMES[tag] = got
+    return got
+
+_LOCALNAMES_LOWER: Dict[str, str] = {}
+
+
+def localname_lower(tag: str) -> str:
+    """strip_ns(tag).lower(), memoized — the form every case-insensitive tag
+    comparison in the readers, detection and the streaming loops wants."""
+    got = _LOCALNAMES_LOWER.get(tag)
+    if got is None:
+        got = strip_ns(tag).lower()
+        if len(_LOCALNAMES_LOWER) < _LOCALNAMES_MAX:
+            _LOCALNAMES_LOWER[tag] = got
+    return got
 
 # ---- RAW versions for validation (no percent-encoding) ----
 def read_link_raw(elem: ET.Element, spec_name: str) -> str:
-    return _read_first_ci(elem, SPEC.get(spec_name, {}).get("link_paths", []))
+    return _read_spec_field(elem, spec_name, "link_paths")
 
 # ---------- PRICE HELPERS (no currency) ----------
 # One shared analysis is used by BOTH the amount parser and the FAVI format
@@ -142,8 +191,7 @@ def read_price_text(elem: ET.Element, spec_name: str) -> str:
     Return the raw textual price as found in the element, with spec-specific paths first,
     then generic fallbacks. Does NOT normalize; use parse_price_text() for that.
     """
-    spec = SPEC.get(spec_name, {})
-    paths: List[str] = spec.get("price_paths", [])
+    paths: List[str] = _spec_paths(spec_name, "price_paths")
 
     # Generic fallbacks are used ONLY when the spec defines no price paths of
     # its own (unknown/unconfigured formats). For a known spec they would mask
@@ -170,7 +218,11 @@ def read_price_text(elem: ET.Element, spec_name: str) -> str:
 
     # Case-insensitive fallback (e.g. feed uses <PRICE> where the spec lists
     # ./price / ./Price). Last resort, after exact paths and amount-attr nodes.
-    return _value_by_localname_ci(elem, _aliases_from_paths(paths + fallback_paths))
+    aliases = (
+        _spec_aliases(spec_name, "price_paths", paths)
+        if paths else _aliases_from_paths(fallback_paths)
+    )
+    return _value_by_localname_ci(elem, aliases)
 
 def read_price(elem: ET.Element, spec_name: str) -> tuple[float | None, str]:
     """
@@ -181,13 +233,7 @@ def read_price(elem: ET.Element, spec_name: str) -> tuple[float | None, str]:
     amt = parse_price_text(raw)
     return amt, raw
 
-def _looks_like_google_without_ns(root: ET.Element) -> bool:
-    try:
-        root_xml = ET.tostring(root, encoding="utf-8", method="xml")
-    except Exception:
-        root_xml = b""
-    if b"base.google.com/ns/1.0" in root_xml:
-        return False
+def _looks_like_google_without_ns(items: List[ET.Element]) -> bool:
     # Google Shopping without the g: namespace ships in more than one wrapper:
     # the canonical <rss><channel>, but also a bare <items> root (Channable
     # exports, e.g. vidaXL.cz). Don't gate on the root tag — the item-level
@@ -195,34 +241,20 @@ def _looks_like_google_without_ns(root: ET.Element) -> bool:
     # real discriminator, and it keeps marketplace formats out: Jeftinije uses
     # <Item> with <mainImage>/<slikaVelika>, Ceneo <o>, Heureka <SHOPITEM> —
     # none carry an <image_link> child, so none satisfy `core` below.
-    items = root.findall(".//item")[:5]  # look at up to 5 items
+    # `items` are the first (up to 5) plain <item> descendants; the caller has
+    # already ruled out the g: namespace.
     if not items:
         return False
     googleish = {"id","link","image_link","price","availability","product_type","title","description"}
     core = {"id","link","image_link"}
     for it in items:
-        locals_ = {strip_ns(c.tag).lower() for c in list(it)}
+        locals_ = {localname_lower(c.tag) for c in it}
         if core <= locals_ and len(locals_ & googleish) >= 3:
             return True
     return False
 
 def gather_primary_image_raw(elem: ET.Element, spec_name: str) -> str:
-    paths = SPEC.get(spec_name, {}).get("image_primary_paths", [])
-    return _read_first_ci(elem, paths)
-
-def _exists_local(root: ET.Element, localname: str) -> bool:
-    lname = localname.lower()
-    for e in root.iter():
-        if isinstance(e.tag, str) and strip_ns(e.tag).lower() == lname:
-            return True
-    return False
-
-def _first_local(root: ET.Element, localname: str) -> ET.Element | None:
-    lname = localname.lower()
-    for e in root.iter():
-        if isinstance(e.tag, str) and strip_ns(e.tag).lower() == lname:
-            return e
-    return None
+    return _read_spec_field(elem, spec_name, "image_primary_paths")
 
 def _text(n) -> str:
     return (n.text or "").strip()
@@ -244,13 +276,13 @@ def _select_value(elem: ET.Element, path: str) -> str:
     # attribute of a found child: '.../@attr'
     if "/@" in path:
         node_path, attr = path.rsplit("/@", 1)
-        n = elem.find(node_path, namespaces=NS)
+        n = elem.find(_clark(node_path))
         if n is not None:
             return (n.get(attr) or "").strip()
         return ""
 
     # normal element text
-    n = elem.find(path, namespaces=NS)
+    n = elem.find(_clark(path))
     return (n.text or "").strip() if n is not None and n.text else ""
 
 def _first_node(elem: ET.Element, paths: List[str]) -> ET.Element | None:
@@ -267,7 +299,7 @@ def _first_node(elem: ET.Element, paths: List[str]) -> ET.Element | None:
             return elem
         if "/@" in p:
             node_path, _ = p.rsplit("/@", 1)
-        n = elem.find(node_path, namespaces=NS)
+        n = elem.find(_clark(node_path))
         if n is not None:
             return n
     return None
@@ -285,7 +317,7 @@ def _all(elem: ET.Element, paths: List[str]) -> List[str]:
         # collect attributes if '/@' is used, else element texts
         if "/@" in p:
             node_path, attr = p.rsplit("/@", 1)
-            for n in elem.findall(node_path, namespaces=NS):
+            for n in elem.findall(_clark(node_path)):
                 v = (n.get(attr) or "").strip()
                 if v:
                     out.append(v)
@@ -294,7 +326,7 @@ def _all(elem: ET.Element, paths: List[str]) -> List[str]:
             if v:
                 out.append(v)
         else:
-            for n in elem.findall(p, namespaces=NS):
+            for n in elem.findall(_clark(p)):
                 v = (n.text or "").strip()
                 if v:
                     out.append(v)
@@ -529,17 +561,90 @@ SPEC: Dict[str, Dict[str, Any]] = {
     },
 }
 
+# Every SPEC *_paths list with prefixes expanded once and the Clark/prefixed
+# twins ("./{uri}id" next to "./g:id") collapsed, so a miss probes each node
+# once instead of twice.
+_SPEC_PATHS: Dict[Tuple[str, str], List[str]] = {
+    (spec_name, key): list(dict.fromkeys(_clark(p.strip()) for p in paths if p.strip()))
+    for spec_name, cfg in SPEC.items()
+    for key, paths in cfg.items()
+    if key.endswith("_paths")
+}
+
+
+def _spec_paths(spec_name: str, key: str) -> List[str]:
+    got = _SPEC_PATHS.get((spec_name, key))
+    return got if got is not None else SPEC.get(spec_name, {}).get(key, [])
+
 # -------------------- Detection --------------------
-def _exists(root, xpath: str) -> bool:
-    return root.find(xpath, namespaces=NS) is not None
+_GOOGLE_NS_URI = "base.google.com/ns/1.0"
+# Case-insensitive localnames the detector asks about, and the exact
+# (un-namespaced) descendant tags it prefers as samples — the old
+# root.find(".//Item") & co. Collected by ONE walk in _detection_facts.
+_DETECT_LOCALS = frozenset({"entry", "item", "shopitem", "o", "product"})
+_DETECT_EXACT = frozenset({"o", "Item", "product"})
+
+
+def _mentions_google_ns(e: ET.Element) -> bool:
+    # Same test the detector used to run on ET.tostring(root): the URI shows up
+    # in the serialized tree iff some tag, attribute or text carries it.
+    tag = e.tag
+    if isinstance(tag, str) and _GOOGLE_NS_URI in tag:
+        return True
+    if (e.text and _GOOGLE_NS_URI in e.text) or (e.tail and _GOOGLE_NS_URI in e.tail):
+        return True
+    return any(_GOOGLE_NS_URI in k or _GOOGLE_NS_URI in v for k, v in e.attrib.items())
+
+
+def _detection_facts(root: ET.Element) -> Dict[str, Any]:
+    """
+    Walk the tree once and collect everything detect_spec() branches on.
+
+    Before, every branch re-walked the tree (root.iter() per localname probe,
+    find() per exact tag) and the whole tree was serialized just to look for
+    the g: namespace URI — up to ~7 passes on a feed that matched nothing.
+    """
+    google_ns = False
+    first_local: Dict[str, ET.Element] = {}
+    first_exact: Dict[str, ET.Element] = {}
+    plain_items: List[ET.Element] = []
+    for e in root.iter():
+        if not google_ns:
+            google_ns = _mentions_google_ns(e)
+        tag = e.tag
+        if not isinstance(tag, str):
+            continue
+        local = localname_lower(tag)
+        if local in _DETECT_LOCALS and local not in first_local:
+            first_local[local] = e
+        if e is root:
+            continue  # ".//x" only matches descendants
+        if tag in _DETECT_EXACT and tag not in first_exact:
+            first_exact[tag] = e
+        if tag == "item" and len(plain_items) < 5:
+            plain_items.append(e)
+    return {
+        "google_ns": google_ns,
+        "first_local": first_local,
+        "first_exact": first_exact,
+        "plain_items": plain_items,
+    }
+
+
+def _detect_sample(facts: Dict[str, Any], exact: str) -> ET.Element | None:
+    # Prefer the exact-case descendant, else the first case-insensitive match.
+    sample = facts["first_exact"].get(exact)
+    if sample is None:
+        sample = facts["first_local"].get(exact.lower())
+    return sample
 
 def _root_local(root: ET.Element) -> str:
     return strip_ns(root.tag).lower() if isinstance(root.tag, str) else ""
 
 def _child_localnames(elem: ET.Element) -> set[str]:
     return {
-        strip_ns(child.tag).lower()
-        for child in list(elem)
+        localname_lower(child.tag)
+        for child in elem
         if isinstance(child.tag, str)
     }
 
@@ -551,122 +656,111 @@ def _matches_expected_root(root: ET.Element, spec_name: str) -> bool:
     return not expected or _root_local(root) in expected
 
 def detect_spec(root: ET.Element) -> str:
-    root_xml = ET.tostring(root, encoding="utf-8", method="xml")
+    facts = _detection_facts(root)
+    google_ns = facts["google_ns"]
+    first_local = facts["first_local"]
 
     # Google Atom
-    if any(strip_ns(e.tag).lower() == "entry" for e in root.iter()):
-        if b"base.google.com/ns/1.0" in root_xml:
-            return "Google Merchant (g:) Atom"
+    if "entry" in first_local and google_ns:
+        return "Google Merchant (g:) Atom"
     # Google RSS
-    if _exists(root, ".//item"):
-        if b"base.google.com/ns/1.0" in root_xml:
-            return "Google Merchant (g:) RSS"
+    if facts["plain_items"] and google_ns:
+        return "Google Merchant (g:) RSS"
 
     # Google RSS (no g: namespace) — must come BEFORE marketplace checks
-    if _looks_like_google_without_ns(root):
+    if not google_ns and _looks_like_google_without_ns(facts["plain_items"]):
         return "Google Merchant (no-namespace) RSS"
 
     # Heureka: SHOPITEM (case-insensitive)
-    if _exists(root, ".//SHOPITEM") or _exists_local(root, "shopitem"):
+    if "shopitem" in first_local:
         return "Heureka strict"
 
     # CENEO: <o> anywhere
-    if _exists(root, ".//o") or _exists_local(root, "o"):
-        sample = root.find(".//o")
-        if sample is None:
-            sample = _first_local(root, "o")
-        if sample is not None:
-            attr_names = _attr_names(sample)
-            child_names = _child_localnames(sample)
-            ceneo_hits = len(attr_names & {"id", "price", "url", "avail", "availability", "stock"})
-            ceneo_hits += len(child_names & {"name", "price", "cat", "imgs", "desc"})
-            if _matches_expected_root(root, "Ceneo strict") and ceneo_hits >= 3:
-                return "Ceneo strict"
+    sample = _detect_sample(facts, "o")
+    if sample is not None:
+        attr_names = _attr_names(sample)
+        child_names = _child_localnames(sample)
+        ceneo_hits = len(attr_names & {"id", "price", "url", "avail", "availability", "stock"})
+        ceneo_hits += len(child_names & {"name", "price", "cat", "imgs", "desc"})
+        if _matches_expected_root(root, "Ceneo strict") and ceneo_hits >= 3:
+            return "Ceneo strict"
 
     # CENEJE / JEFTINIJE: <Item> or <item> anywhere
     # Distinguish between attribute-based (Ceneje.si) and element-based (Jeftinije)
-    if _exists(root, ".//Item") or _exists_local(root, "item"):
-        sample = root.find(".//Item")
-        if sample is None:
-            sample = _first_local(root, "item")
-        if sample is not None:
-            child_names = _child_localnames(sample)
-            attr_names = _attr_names(sample)
-
-            # Check if it uses attributes (Ceneje.si style) or child elements (Jeftinije style)
-            has_attr_id = sample.get("ID") is not None or sample.get("id") is not None
-            has_attr_price = sample.get("price") is not None
-            has_attr_link = sample.get("link") is not None
-            has_elem_id = sample.find("./ID") is not None or sample.find("./id") is not None
-
-            attr_hits = len(attr_names & {
-                "id", "link", "price", "slikavelika", "slikamala", "image", "mainimage"
-            })
-            elem_hits = len(child_names & {
-                "id", "name", "link", "mainimage", "image", "slikavelika", "slikamala",
-                "price", "availability", "description"
-            })
-
-            if (
-                (has_attr_id or has_attr_price or has_attr_link)
-                and _matches_expected_root(root, "Ceneje.si (attribute-based)")
-                and attr_hits >= 2
-            ):
-                return "Ceneje.si (attribute-based)"
-            elif (
-                has_elem_id
-                and _matches_expected_root(root, "Jeftinije / Ceneje (element-based)")
-                and elem_hits >= 3
-            ):
-                return "Jeftinije / Ceneje (element-based)"
+    sample = _detect_sample(facts, "Item")
+    if sample is not None:
+        child_names = _child_localnames(sample)
+        attr_names = _attr_names(sample)
+
+        # Check if it uses attributes (Ceneje.si style) or child elements (Jeftinije style)
+        has_attr_id = sample.get("ID") is not None or sample.get("id") is not None
+        has_attr_price = sample.get("price") is not None
+        has_attr_link = sample.get("link") is not None
+        has_elem_id = sample.find("./ID") is not None or sample.find("./id") is not None
+
+        attr_hits = len(attr_names & {
+            "id", "link", "price", "slikavelika", "slikamala", "image", "mainimage"
+        })
+        elem_hits = len(child_names & {
+            "id", "name", "link", "mainimage", "image", "slikavelika", "slikamala",
+            "price", "availability", "description"
+        })
+
+        if (
+            (has_attr_id or has_attr_price or has_attr_link)
+            and _matches_expected_root(root, "Ceneje.si (attribute-based)")
+            and attr_hits >= 2
+        ):
+            return "Ceneje.si (attribute-based)"
+        elif (
+            has_elem_id
+            and _matches_expected_root(root, "Jeftinije / Ceneje (element-based)")
+            and elem_hits >= 3
+        ):
+            return "Jeftinije / Ceneje (element-based)"
 
     # Compari / Skroutz: look for <product>. Skroutz has price_with_vat.
-    if _exists(root, ".//product") or _exists_local(root, "product"):
-        sample = root.find(".//product", namespaces=NS)
-        if sample is None:
-            sample = _first_local(root, "product")
-        if sample is not None:
-            child_names = _child_localnames(sample)
-
-            skroutz_hits = len(child_names & {"id", "name", "link", "image", "price_with_vat", "category"})
-            if (
-                "price_with_vat" in child_names
-                and _matches_expected_root(root, "Skroutz strict")
-                and skroutz_hits >= 3
-            ):
-                return "Skroutz strict"
-
-            compari_hits = len(child_names & {
-                "identifier", "productid", "name", "product_url", "image_url",
-                "price", "category", "description"
-            })
-            # Require at least one Compari-DISTINCTIVE tag. Generic fields
-            # (name/price/category/description) alone would misclassify any
-            # generic <product> feed as Compari, whose path table then reads
-            # <link>/<image> as empty and mass-flags missing URLs/images.
-            compari_distinctive = child_names & {
-                "identifier", "productid", "product_url", "producturl",
-                "image_url", "imageurl",
-            }
-            if (
-                _matches_expected_root(root, "Compari / Árukereső / Pazaruvaj (case-insensitive)")
-                and compari_hits >= 3
-                and compari_distinctive
-            ):
-                return "Compari / Árukereső / Pazaruvaj (case-insensitive)"
-
-    # Fallbacks for odd Google
-    if any(strip_ns(e.tag).lower() == "entry" for e in root.iter()) and b"base.google.com/ns/1.0" in root_xml:
-        return "Google Merchant (g:) Atom"
-    if (_exists(root, ".//item") or _exists_local(root, "item")) and b"base.google.com/ns/1.0" in root_xml:
+    sample = _detect_sample(facts, "product")
+    if sample is not None:
+        child_names = _child_localnames(sample)
+
+        skroutz_hits = len(child_names & {"id", "name", "link", "image", "price_with_vat", "category"})
+        if (
+            "price_with_vat" in child_names
+            and _matches_expected_root(root, "Skroutz strict")
+            and skroutz_hits >= 3
+        ):
+            return "Skroutz strict"
+
+        compari_hits = len(child_names & {
+            "identifier", "productid", "name", "product_url", "image_url",
+            "price", "category", "description"
+        })
+        # Require at least one Compari-DISTINCTIVE tag. Generic fields
+        # (name/price/category/description) alone would misclassify any
+        # generic <product> feed as Compari, whose path table then reads
+        # <link>/<image> as empty and mass-flags missing URLs/images.
+        compari_distinctive = child_names & {
+            "identifier", "productid", "product_url", "producturl",
+            "image_url", "imageurl",
+        }
+        if (
+            _matches_expected_root(root, "Compari / Árukereső / Pazaruvaj (case-insensitive)")
+            and compari_hits >= 3
+            and compari_distinctive
+        ):
+            return "Compari / Árukereső / Pazaruvaj (case-insensitive)"
+
+    # Fallback for odd Google: namespaced or oddly-cased <item>s. (The <entry>
+    # case is fully covered by the Atom check at the top.)
+    if "item" in first_local and google_ns:
         return "Google Merchant (g:) RSS"
 
     return "UNKNOWN"
 
 # -------------------- Shared image & field accessors --------------------
 def gather_primary_image(elem: ET.Element, spec_name: str, do_percent_encode: bool = True) -> str:
-    paths = SPEC.get(spec_name, {}).get("image_primary_paths", [])
-    prim = _read_first_ci(elem, paths)
+    prim = _read_spec_field(elem, spec_name, "image_primary_paths")
     if do_percent_encode and prim:
         prim = percent_encode_url(prim)
     return prim
@@ -675,10 +769,12 @@ def gather_gallery(elem: ET.Element, spec_name: str, do_percent_encode: bool = T
     """
     Return gallery images if configured for the spec.
     """
-    paths = SPEC.get(spec_name, {}).get("image_gallery_paths", [])
+    paths = _spec_paths(spec_name, "image_gallery_paths")
     out: List[str] = _all(elem, paths) if paths else []
     if not out and paths:
-        out = _values_by_localname_ci(elem, _aliases_from_paths(paths))
+        out = _values_by_localname_ci(
+            elem, _spec_aliases(spec_name, "image_gallery_paths", paths)
+        )
     if do_percent_encode:
         out = [percent_encode_url(u) for u in out if u]
     # de-dup & keep order
@@ -689,11 +785,11 @@ def gather_gallery(elem: ET.Element, spec_name: str, do_percent_encode: bool = T
     return dedup
 
 def get_item_nodes(root: ET.Element, spec_name: str) -> List[ET.Element]:
-    paths = SPEC.get(spec_name, {}).get("item_paths", [])
+    paths = _spec_paths(spec_name, "item_paths")
     nodes: List[ET.Element] = []
     # 1) Try configured XPaths (fast path)
     for p in paths:
-        nodes += root.findall(p, namespaces=NS)
+        nodes += root.findall(_clark(p))
     if nodes:
         return nodes
 
@@ -712,15 +808,15 @@ def get_item_nodes(root: ET.Element, spec_name: str) -> List[ET.Element]:
     out: List[ET.Element] = []
     want = set(desired)
     for e in root.iter():
-        if isinstance(e.tag, str) and strip_ns(e.tag).lower() in want:
+        if isinstance(e.tag, str) and localname_lower(e.tag) in want:
             out.append(e)
     return out
 
 def read_id(elem: ET.Element, spec_name: str) -> str:
-    return _read_first_ci(elem, SPEC.get(spec_name, {}).get("id_paths", []))
+    return _read_spec_field(elem, spec_name, "id_paths")
 
 def read_link(elem: ET.Element, spec_name: str) -> str:
-    val = _read_first_ci(elem, SPEC.get(spec_name, {}).get("link_paths", []))
+    val = _read_spec_field(elem, spec_name, "link_paths")
     return percent_encode_url(val) if val else ""
 
 def _value_by_localname_ci(elem: ET.Element, aliases: List[str]) -> str:
@@ -736,18 +832,24 @@ def _value_by_localname_ci(elem: ET.Element, aliases: List[str]) -> str:
     """
     if not aliases:
         return ""
+    # Only children/attributes named like an alias are collected: a typical
+    # item has far more fields than the handful of aliases being asked for,
+    # and stripping every other child's text was the bulk of the work.
+    wanted = {alias.lower() for alias in aliases}
     child_vals: Dict[str, str] = {}
-    for child in list(elem):
+    for child in elem:
         if not isinstance(child.tag, str):
             continue
-        local = strip_ns(child.tag).lower()
+        local = localname_lower(child.tag)
+        if local not in wanted or local in child_vals:
+            continue
         txt = (child.text or "").strip()
-        if txt and local not in child_vals:
+        if txt:
             child_vals[local] = txt
     attr_vals: Dict[str, str] = {
         str(k).lower(): (v or "").strip()
         for k, v in (elem.attrib or {}).items()
-        if (v or "").strip()
+        if str(k).lower() in wanted and (v or "").strip()
     }
     for alias in aliases:
         key = alias.lower()
@@ -766,8 +868,8 @@ def _values_by_localname_ci(elem: ET.Element, aliases: List[str]) -> List[str]:
         return []
     wanted = {a.lower() for a in aliases}
     out: List[str] = []
-    for child in list(elem):
-        if isinstance(child.tag, str) and strip_ns(child.tag).lower() in wanted:
+    for child in elem:
+        if isinstance(child.tag, str) and localname_lower(child.tag) in wanted:
             txt = (child.text or "").strip()
             if txt:
                 out.append(txt)
@@ -809,20 +911,46 @@ def _aliases_from_paths(paths: List[str]) -> List[str]:
     return out
 
 
-def _read_first_ci(elem: ET.Element, paths: List[str]) -> str:
+# Fallback aliases for every SPEC *_paths list, derived once at import. The
+# readers below run per item and per field, so re-deriving the same aliases
+# from the same paths on every exact-path miss was pure repeated work.
+_SPEC_PATH_ALIASES: Dict[Tuple[str, str], List[str]] = {
+    (spec_name, key): _aliases_from_paths(paths)
+    for spec_name, cfg in SPEC.items()
+    for key, paths in cfg.items()
+    if key.endswith("_paths")
+}
+
+
+def _spec_aliases(spec_name: str, key: str, paths: List[str]) -> List[str]:
+    aliases = _SPEC_PATH_ALIASES.get((spec_name, key))
+    return aliases if aliases is not None else _aliases_from_paths(paths)
+
+
+def _read_first_ci(elem: ET.Element, paths: List[str],
+                   aliases: List[str] | None = None) -> str:
     """Exact-path read with a case-insensitive localname fallback derived from
     the same paths. The fallback fires only when the exact (case-sensitive)
     XPaths miss, so it can only turn a false 'missing' into the real value — it
-    never overrides a successful exact match."""
+    never overrides a successful exact match. Pass `aliases` when they are
+    already known (see _read_spec_field)."""
     val = _first(elem, paths) if paths else ""
     if val:
         return val
-    return _value_by_localname_ci(elem, _aliases_from_paths(paths))
+    if aliases is None:
+        aliases = _aliases_from_paths(paths)
+    return _value_by_localname_ci(elem, aliases)
+
+
+def _read_spec_field(elem: ET.Element, spec_name: str, key: str) -> str:
+    """_read_first_ci over SPEC[spec_name][key] with the precomputed aliases."""
+    paths = _spec_paths(spec_name, key)
+    return _read_first_ci(elem, paths, _spec_aliases(spec_name, key, paths))
 
 
 def read_availability(elem: ET.Element, spec_name: str) -> str:
     # First try explicit availability paths
-    paths = SPEC.get(spec_name, {}).get("availability_paths", [])
+    paths = _spec_paths(spec_name, "availability_paths")
     val = _first(elem, paths) if paths else ""
     if val:
         return val
@@ -962,10 +1090,10 @@ def _named_param_values(elem: ET.Element) -> Dict[str, str]:
             for value in (attr_val, (sub.text or "").strip())
             if value
         ]
-        for g in list(sub):
+        for g in sub:
             if not isinstance(g.tag, str):
                 continue
-            g_local = strip_ns(g.tag).lower()
+            g_local = localname_lower(g.tag)
             if g_local in _PARAM_NAME_LOCALS and not nm:
                 nm = (g.text or "").strip().lower()
             elif g_local in _PARAM_VALUE_LOCALS:
@@ -977,12 +1105,12 @@ def _named_param_values(elem: ET.Element) -> Dict[str, str]:
         val = " | ".join(dict.fromkeys(value_parts))
         return nm, val
 
-    for child in list(elem):
+    for child in elem:
         if not isinstance(child.tag, str):
             continue
-        local = strip_ns(child.tag).lower()
+        local = localname_lower(child.tag)
         if local in _PARAM_CONTAINER_LOCALS:
-            for sub in list(child):
+            for sub in child:
                 if not isinstance(sub.tag, str):
                     continue
                 nm, val = _pair_from(sub)
@@ -993,44 +1121,84 @@ def _named_param_values(elem: ET.Element) -> Dict[str, str]:
     return out
 
 
-def _present_value_localnames(elem: ET.Element) -> set[str]:
-    """Localnames (lowercased) that carry a value on this item element.
+# (key, aliases in lookup order) for read_recommended_fields().
+_RECOMMENDED_LOOKUP: List[Tuple[str, List[str]]] = [
+    (field["key"], sorted(field["aliases"])) for field in RECOMMENDED_FIELDS
+]
+
+
+def read_recommended_fields(
+    elem: ET.Element, named: Dict[str, str] | None = None,
+) -> Tuple[set[str], Dict[str, str]]:
+    """Presence and value of EVERY RECOMMENDED_FIELDS key, off one scan of the
+    item. Returns (present keys, {key: value}).
 
-    A direct child counts when it has non-empty text, sub-children (container
+    A field is present when one of its aliases (lowercased localname) carries
+    a value: a direct child with non-empty text, sub-children (container
     elements such as Heureka <DELIVERY> or Google <g:shipping>), or its own
-    attributes. Item attributes with a non-empty value count too — this is how
-    attribute-based specs (Ceneje.si, Ceneo) expose their fields. Named
-    parameters inside attrs/attributes containers count under their name.
-    """
-    present: set[str] = set()
-    for child in list(elem):
+    attributes; an item attribute with a non-empty value — this is how
+    attribute-based specs (Ceneje.si, Ceneo) expose their fields; or a named
+    parameter inside an attrs/attributes container.
+
+    Values are read alias by alias: direct child text / item attribute first,
+    then named parameters. Callers that also need the named parameters pass
+    their _named_param_values(elem) as `named` so the item is scanned once."""
+    child_vals: Dict[str, str] = {}
+    present_locals: set[str] = set()
+    for child in elem:
         if not isinstance(child.tag, str):
             continue
-        if (child.text or "").strip() or len(child) > 0 or child.attrib:
-            present.add(strip_ns(child.tag).lower())
-    for k, v in (elem.attrib or {}).items():
-        if (v or "").strip():
-            present.add(str(k).lower())
-    present |= set(_named_param_values(elem).keys())
-    return present
+        local = localname_lower(child.tag)
+        txt = (child.text or "").strip()
+        if txt and local not in child_vals:
+            child_vals[local] = txt
+        if txt or len(child) > 0 or child.attrib:
+            present_locals.add(local)
+    attr_vals: Dict[str, str] = {
+        str(k).lower(): (v or "").strip()
+        for k, v in (elem.attrib or {}).items()
+        if (v or "").strip()
+    }
+    if named is None:
+        named = _named_param_values(elem)
+    present_locals.update(attr_vals)
+    present_locals.update(named)
+
+    present = {
+        field["key"]
+        for field in RECOMMENDED_FIELDS
+        if present_locals & field["aliases"]
+    }
+    values: Dict[str, str] = {}
+    for key, aliases in _RECOMMENDED_LOOKUP:
+        val = ""
+        for a in aliases:
+            val = child_vals.get(a) or attr_vals.get(a) or ""
+            if val:
+                break
+        if not val:
+            val = next((named[a] for a in aliases if named.get(a)), "")
+        values[key] = val
+    return present, values
+
+
+_RECOMMENDED_ALIASES: Dict[str, List[str]] = dict(_RECOMMENDED_LOOKUP)
 
 
 def read_recommended_value(elem: ET.Element, key: str) -> str:
     """Value of a RECOMMENDED_FIELDS entry (e.g. 'gtin', 'description',
-    'category') read the same alias-based way presence is detected — direct
-    children / item attributes first, then named parameters."""
-    field = next((f for f in RECOMMENDED_FIELDS if f["key"] == key), None)
-    if field is None:
+    'category') — the same value read_recommended_fields() returns for `key`.
+    Single-key callers (the audit reads only 'gtin') skip the presence set and
+    the other fields; named parameters are only parsed when no direct child
+    or item attribute matches."""
+    aliases = _RECOMMENDED_ALIASES.get(key)
+    if not aliases:
         return ""
-    aliases = sorted(field["aliases"])
     val = _value_by_localname_ci(elem, aliases)
     if val:
         return val
     named = _named_param_values(elem)
-    for a in aliases:
-        if named.get(a):
-            return named[a]
-    return ""
+    return next((named[a] for a in aliases if named.get(a)), "")
 
 
 def is_valid_gtin(code: str) -> bool:
@@ -1044,9 +1212,4 @@ def is_valid_gtin(code: str) -> bool:
 
 def present_recommended_fields(elem: ET.Element) -> set[str]:
     """Return the set of RECOMMENDED_FIELDS keys present (non-empty) on this item."""
-    present_locals = _present_value_localnames(elem)
-    return {
-        field["key"]
-        for field in RECOMMENDED_FIELDS
-        if present_locals & field["aliases"]
-    }
+    return read_recommended_fields(elem)[0]
@@ -226,6 +226,14 @@ class DetectionRegressionTest(unittest.TestCase):
         item = fs.get_item_nodes(ET.fromstring(xml), "Heureka strict")[0]
         self.assertEqual(fs.read_price(item, "Heureka strict"), (None, ""))
 
+    def test_google_fallback_for_namespaced_items(self):
+        # No plain <item> (so the main RSS branch misses), but the g: URI is
+        # in the tree: the single detection walk must still reach the fallback.
+        xml = ('<rss xmlns:g="http://base.google.com/ns/1.0"><channel>'
+               "<g:item><g:id>1</g:id></g:item></channel></rss>")
+        self.assertEqual(fs.detect_spec(ET.fromstring(xml)),
+                         "Google Merchant (g:) RSS")
+
 
 class UrlAndGtinTest(unittest.TestCase):
     def test_percent_encode_idempotent(self):
@@ -259,6 +267,23 @@ class NestedParamsTest(unittest.TestCase):
         # gallery path fixed: Ceneo uses <i url=...>, not <img>
         self.assertEqual(fs.gather_gallery(item, "Ceneo strict"), ["https://x/2.jpg"])
 
+    def test_one_pass_reader_presence_and_values(self):
+        xml = ('<offers><o id="1" url="https://x/p" price="100" avail="1">'
+               '<cat>Meble</cat><name>Sofa</name><desc>  d  </desc><delivery/>'
+               '<attrs><a name="Producent">BRW</a><a name="EAN">6417182041488</a></attrs>'
+               '</o></offers>')
+        item = ET.fromstring(xml).find("o")
+        present, values = fs.read_recommended_fields(item)
+        # An empty <delivery/> carries no value, so it is neither present nor read.
+        self.assertEqual(present, {"title", "description", "category", "brand", "gtin"})
+        self.assertEqual(values, {
+            "title": "Sofa", "description": "d", "category": "Meble",
+            "delivery": "", "brand": "BRW", "gtin": "6417182041488",
+        })
+        self.assertEqual(fs.present_recommended_fields(item), present)
+        self.assertEqual(fs.read_recommended_value(item, "brand"), "BRW")
+        self.assertEqual(fs.read_recommended_value(item, "no_such_key"), "")
+
     def test_atom_summary_counts_as_description(self):
         xml = ('<feed xmlns="http://www.w3.org/2005/Atom" '
                'xmlns:g="http://base.google.com/ns/1.0"><entry>'
@@ -157,6 +157,102 @@ class FilterPageAppTests(unittest.TestCase):
         self.assertIn("**Source:**", markdown)  # validation survived the bad submit
         self.assertIn("🗑 Clear all", [b.label for b in app.button])  # browse survived
 
+    def test_parse_error_keeps_items_checked_before_it(self):
+        """A stray error near the end of a feed must not throw away the items
+        already checked: validation reports the error and still renders the
+        results for the well-formed part, even with stop-on-error ticked."""
+        broken = FIXTURE.replace(b"</channel></rss>", b"<item><g:id>4</g:id></channel>")
+        with open(self.path, "wb") as fh:
+            fh.write(broken)
+        app = AppTest.from_file(str(ROOT / "feed_checker_gui.py"))
+        app.session_state["loaded_feed"] = {
+            "path": self.path, "label": "fixture.xml", "size": len(broken),
+            "content_hash": hashlib.sha256(broken).hexdigest(),
+            "scope": "Auto (full)", "n_limit": 5000, "stop_on_first_parse_error": True,
+        }
+        app.run(timeout=20)
+
+        self.assertEqual(list(app.exception), [])
+        self.assertTrue(any("XML syntax: ERROR" in e.value for e in app.error))
+        self.assertTrue(any("3 items read before it" in w.value for w in app.warning))
+        self.assertIn("Scope:", " ".join(str(c.value) for c in app.caption))
+
+    def test_stop_option_applies_only_before_the_first_item(self):
+        """With nothing readable, the stop option decides between halting at
+        the error and rendering the empty report."""
+        broken = FIXTURE.split(b"<item>", 1)[0] + b"<item><g:id>1</g:id></channel>"
+        with open(self.path, "wb") as fh:
+            fh.write(broken)
+        for stop, report_rendered in ((True, False), (False, True)):
+            with self.subTest(stop_on_first_parse_error=stop):
+                app = AppTest.from_file(str(ROOT / "feed_checker_gui.py"))
+                app.session_state["loaded_feed"] = {
+                    "path": self.path, "label": "fixture.xml", "size": len(broken),
+                    "content_hash": hashlib.sha256(broken).hexdigest(),
+                    "scope": "Auto (full)", "n_limit": 5000,
+                    "stop_on_first_parse_error": stop,
+                }
+                app.run(timeout=20)
+
+                self.assertEqual(list(app.exception), [])
+                self.assertTrue(any("XML syntax: ERROR" in e.value for e in app.error))
+                self.assertFalse(any("items read before it" in w.value for w in app.warning))
+                self.assertEqual(
+                    "Scope:" in " ".join(str(c.value) for c in app.caption),
+                    report_rendered,
+                )
+
+    def test_rerun_reuses_validation_without_reparsing(self):
+        """A rerun that doesn't change the feed or its parse options (here:
+        opening the Browse panel) restores the finished validation instead of
+        parsing again — proven by corrupting the file after the first run."""
+        app = AppTest.from_file(str(ROOT / "feed_checker_gui.py"))
+        app.session_state["loaded_feed"] = {
+            "path": self.path, "label": "fixture.xml", "size": len(FIXTURE),
+            "content_hash": hashlib.sha256(FIXTURE).hexdigest(),
+            "scope": "Auto (full)", "n_limit": 5000, "stop_on_first_parse_error": True,
+        }
+        app.run(timeout=20)
+        first = [s.value for s in app.success]
+        self.assertIn("XML syntax: OK", first)
+
+        with open(self.path, "wb") as fh:
+            fh.write(b"<rss><channel><item>")
+        self._browse_toggle(app).set_value(True)
+        app.run(timeout=20)
+        self.assertEqual(list(app.exception), [])
+        self.assertFalse(any("XML syntax: ERROR" in e.value for e in app.error))
+        self.assertEqual([s.value for s in app.success][:len(first)], first)
+
+    def test_rerun_replays_streaming_hint(self):
+        """Status lines emitted from inside the streaming parser (here the
+        no-items hint) are part of the memoized run and come back on a rerun."""
+        feed = b"<catalog><thing><name>x</name></thing><thing/></catalog>"
+        with open(self.path, "wb") as fh:
+            fh.write(feed)
+        app = AppTest.from_file(str(ROOT / "feed_checker_gui.py"))
+        app.session_state["loaded_feed"] = {
+            "path": self.path, "label": "fixture.xml", "size": len(feed),
+            "content_hash": hashlib.sha256(feed).hexdigest(),
+            "scope": "Sample first N items", "n_limit": 5000,
+            "stop_on_first_parse_error": True,
+        }
+        app.run(timeout=20)
+        hint = [i.value for i in app.info if i.value.startswith("No items matched")]
+        self.assertEqual(len(hint), 1)
+        self.assertIn("thing×2", hint[0])
+
+        with open(self.path, "wb") as fh:
+            fh.write(b"<catalog><thing>")
+        self._browse_toggle(app).set_value(True)
+        app.run(timeout=20)
+        self.assertEqual(list(app.exception), [])
+        self.assertFalse(any("XML syntax: ERROR" in e.value for e in app.error))
+        self.assertEqual(
+            [i.value for i in app.info if i.value.startswith("No items matched")],
+            hint,
+        )
+
     def test_collapsing_browse_panel_leaves_validation_full_width(self):
         """Switching the Browse panel off drops the right half entirely — no ②
         subheader, no filter UI — while validation renders to completion at the